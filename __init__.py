@@ -14,7 +14,8 @@ from .json_walker import (
     JSONWalker as JSONWalker,
     JSONSplitWalker as JSONSplitWalker,
     SKIP_LIST as SKIP_LIST,
-    JSONPath as JSONPath
+    JSONPath as JSONPath,
+    JSONQuery as JSONQuery
 )
 
 VERSION = (1, 0, 4)
@@ -27,10 +28,13 @@ def load_jsonc(jsonc_path: Union[Path, str]) -> JSONWalker:
     '''
     if isinstance(jsonc_path, str):
         jsonc_path = Path(jsonc_path)
+    jsonc_bytes = jsonc_path.read_bytes()
+    # Same encoding detection as json.loads uses for bytes (handles BOM)
+    jsonc_text = jsonc_bytes.decode(
+        json.detect_encoding(jsonc_bytes), 'surrogatepass')
+    del jsonc_bytes
     try:
-        with jsonc_path.open(encoding='utf8') as jsonc_file:
-            data = json.load(jsonc_file)
+        data = json.loads(jsonc_text)
     except json.JSONDecodeError:
-        with jsonc_path.open(encoding='utf8') as jsonc_file:
-            data = json.load(jsonc_file, cls=JSONCDecoder)
+        data = json.loads(jsonc_text, cls=JSONCDecoder)
     return JSONWalker(data)
@@ -2,8 +2,125 @@
 A module that provides a custom JSON encoder for JSON-like data structures,
 that is more compact than the default encoder but still readable.
 '''
-from typing import Any, TypeGuard, Union, Iterator, cast
+from typing import Any, Callable, Iterator, cast
+from json.encoder import encode_basestring_ascii
 import json
+import threading
+
+# New line followed by the indentation for each depth and the same strings
+# preceded by a comma (used to separate items). Extended on demand by
+# _extend_indent_cache()
+_NEWLINE_CACHE: list[str] = ['\n']
+_SEPARATOR_CACHE: list[str] = [',\n']
+_INDENT_CACHE_LOCK = threading.Lock()
+
+# Types that can be dispatched with a simple type() identity check
+_SUPPORTED_TYPES = frozenset(
+    (dict, list, tuple, str, bool, int, float, type(None)))
+
+# Types of the items of the lists that are written in a single line
+_PRIM_TYPES = frozenset((int, bool, str, float))
+
+def _extend_indent_cache(depth: int) -> None:
+    '''
+    Makes sure that the indentation caches have items up to the depth. The
+    items are built from their indices under a lock, so the threads that
+    reach a new depth at the same time can't add wrong items.
+    '''
+    with _INDENT_CACHE_LOCK:
+        for i in range(len(_NEWLINE_CACHE), depth + 1):
+            # The callers check the length of _NEWLINE_CACHE (without the
+            # lock), so it's extended last
+            _SEPARATOR_CACHE.append(',\n' + '\t' * i)
+            _NEWLINE_CACHE.append('\n' + '\t' * i)
+
+def _base_type(obj: object) -> type:
+    '''
+    Returns the supported type that the object is an instance of. Used only
+    for the subclasses of the supported types (like OrderedDict).
+    '''
+    for base in (dict, list, tuple, str, bool, int, float):
+        if isinstance(obj, base):
+            return base
+    return type(obj)
+
+def _fmt_bool(obj: bool) -> str:
+    '''Returns the JSON representation of a boolean.'''
+    return 'true' if obj else 'false'
+
+# Functions that format the items of the lists written in a single line
+# (the items of _PRIM_TYPES)
+_FMT: dict[type, Callable[[Any], str]] = {
+    str: encode_basestring_ascii,
+    int: int.__repr__,
+    float: float.__repr__,
+    bool: _fmt_bool,
+}
+
+def _iterencode(o: Any, depth: int, buf: list[str]) -> None:
+    '''
+    Appends the string representation of the object to the buffer. The
+    indentation before the object is added by the caller (together with
+    the separator of the items). This is the implementation of the
+    :class:`CompactEncoder`.
+
+    :param o: the object to encode.
+    :param depth: the indentation level of the object.
+    :param buf: the list of the strings that make up the output.
+    '''
+    t = type(o)  # pyright: ignore[reportUnknownVariableType]
+    if t not in _SUPPORTED_TYPES:
+        t = _base_type(o)
+    if t is dict:
+        o = cast(dict[Any, Any], o)
+        if len(o) == 0:
+            buf.append('{}')
+            return
+        if len(_NEWLINE_CACHE) <= depth + 1:
+            _extend_indent_cache(depth + 1)
+        separator = _SEPARATOR_CACHE[depth + 1]
+        buf.append('{')
+        first = len(buf)
+        for k, v in o.items():
+            buf.append(separator)
+            buf.append(
+                encode_basestring_ascii(k) if type(k) is str
+                else json.dumps(k))
+            buf.append(': ')
+            _iterencode(v, depth + 1, buf)
+        buf[first] = _NEWLINE_CACHE[depth + 1]  # No comma before the 1st
+        buf.append(_NEWLINE_CACHE[depth])
+        buf.append('}')
+    elif t is list or t is tuple:
+        o = cast(list[Any], o)
+        if all(type(i) in _PRIM_TYPES for i in o):
+            parts = [_FMT[type(i)](i) for i in o]
+            buf.append('[' + ', '.join(parts) + ']')
+            return
+        if len(_NEWLINE_CACHE) <= depth + 1:
+            _extend_indent_cache(depth + 1)
+        separator = _SEPARATOR_CACHE[depth + 1]
+        buf.append('[')
+        first = len(buf)
+        for i in o:
+            buf.append(separator)
+            _iterencode(i, depth + 1, buf)
+        buf[first] = _NEWLINE_CACHE[depth + 1]  # No comma before the 1st
+        buf.append(_NEWLINE_CACHE[depth])
+        buf.append(']')
+    elif t is str:
+        buf.append(encode_basestring_ascii(o))
+    elif t is bool:
+        buf.append(_fmt_bool(o))
+    elif t is int:
+        buf.append(int.__repr__(o))
+    elif t is float:
+        buf.append(float.__repr__(o))
+    elif o is None:
+        buf.append('null')
+    else:
+        raise TypeError(
+            f'Object of type {type(o).__name__} is not JSON serializable')
 
 class CompactEncoder(json.JSONEncoder):
     '''
@@ -13,14 +130,6 @@ class CompactEncoder(json.JSONEncoder):
     the lists of primitives are not split into multiple lines.
     '''
 
-    def __init__(self, *args: Any, **kwargs: Any):
-        super().__init__(*args, **kwargs)
-        self.__indent: int = -1
-        self.respect_indent: bool = True
-
-    def _is_primitive(self, obj: Any) -> TypeGuard[Union[int, bool, str, float]]:
-        return isinstance(obj, (int, bool, str, float))
-
     def encode(self, o: Any) -> str:
         '''
         Return a JSON string representation of a Python data structure.
@@ -29,12 +138,13 @@ class CompactEncoder(json.JSONEncoder):
             >>> CompactEncoder().encode({"foo": ["bar", "baz"]})
             '{\\n\\t"foo": ["bar", "baz"]\\n}'
         '''
-        return ''.join(self.iterencode(o))
+        buf: list[str] = []
+        _iterencode(o, 0, buf)
+        return ''.join(buf)
 
     def iterencode(self, o: Any, *args: Any) -> Iterator[str]:  # type: ignore
         '''
-        Encode the given object and yield each string representation line by
-        line.
+        Encode the given object and yield its string representation.
 
         Example:
             >>> item = {"foo": ["bar", "baz"]}
@@ -42,59 +152,4 @@ class CompactEncoder(json.JSONEncoder):
             ... CompactEncoder().encode(item)
             True
         '''
-        self.__indent += 1
-        if self.respect_indent:
-            ind = self.__indent*'\t'
-        else:
-            ind = ''
-        if isinstance(o, dict):
-            o = cast(dict[Any, Any], o)
-            if len(o) == 0:
-                yield f"{ind}{{}}"
-            else:
-                body: list[str] = []
-                for k, v in o.items():
-                    body.extend([
-                        f'{j[:self.__indent]}{json.dumps(k)}: {j[self.__indent:]}'
-                        for j in self.iterencode(v)
-                    ])
-                body_str = ",\n".join(body)
-                yield (
-                    f'{ind}{{\n'
-                    f'{body_str}\n'
-                    f'{ind}}}'
-                )
-        elif isinstance(o, (list, tuple)):
-            o = cast(list[Any], o)
-            primitive_list = True
-            for i in o:
-                if not self._is_primitive(i):
-                    primitive_list = False
-                    break
-            if primitive_list:
-                body = []
-                self.respect_indent = False
-                for i in o:
-                    body.extend(self.iterencode(i))
-                self.respect_indent = True
-                yield f'{ind}[{", ".join(body)}]'
-            else:
-                body = []
-                for i in o:
-                    body.extend(self.iterencode(i))
-                body_str = ",\n".join(body)
-                yield (
-                    f'{ind}[\n'
-                    f'{body_str}\n'
-                    f'{ind}]'
-                )
-        elif self._is_primitive(o):
-            if isinstance(o, str):
-                yield f'{ind}{json.dumps(o)}'
-            else:
-                yield f'{ind}{str(o).lower()}'
-        elif o is None:
-            yield f'{ind}null'
-        else:
-            raise TypeError('Object of type set is not JSON serializable')
-        self.__indent -= 1
+        yield self.encode(o)
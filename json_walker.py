@@ -2,13 +2,18 @@
 A module that provides tools for easy access to JSON data using JSON paths.
 '''
 from __future__ import annotations
+import functools
 import json
 import re
-from typing import Union, Type, Optional, IO, Callable, Iterator, Any
+from typing import (
+    Union, Type, Optional, IO, Callable, Iterable, Iterator, Any, cast)
 
 class SKIP_LIST:
     '''Used as literal value for JSONSplitWalker paths'''
 
+# Marks the items that don't exist yet in JSONWalker.create_path
+_MISSING: Any = object()
+
 # def _remove_escape_characters(text: str) -> str:
 #     '''Prints to a string, removint the escape characters'''
 #     with io.StringIO() as output:
@@ -16,13 +21,46 @@ class SKIP_LIST:
 #         contents = output.getvalue()
 #     return contents
 
+@functools.lru_cache(maxsize=256)
+def _compile_fullmatch(pattern: str) -> Callable[[str], Optional[re.Match[str]]]:
+    '''
+    Returns the fullmatch function of compiled regular expression. The
+    results are cached, so the walkers that use the same patterns share the
+    compiled objects.
+    '''
+    return re.compile(pattern).fullmatch
+
+def _check_split_key(key: Any) -> None:
+    '''
+    Checks if the key can be used with the `//` operator.
+
+    :raises:
+        :class:`TypeError` - invalid input data type
+
+        :class:`re.error` - invlid regular expression.
+    '''
+    if id(key) in _SPLIT_DISPATCH:
+        return
+    if isinstance(key, str):
+        _compile_fullmatch(key)
+        return
+    raise TypeError(
+        'Key must be a regular expression or one of the values: '
+        'str, int, or None')
+
+# Precompiled patterns used for converting the paths to and from strings
+_JS_NAME_FULLMATCH = re.compile("[a-zA-Z$_]+[a-zA-Z$_0-9]*").fullmatch
+_PATH_NAME_MATCH = re.compile(r"\.([a-zA-Z$_]+[a-zA-Z$_0-9]*)").match
+_PATH_QUOTED_KEY_MATCH = re.compile(r'\[("(?:[^"]|\\")*")\]').match
+_PATH_INDEX_MATCH = re.compile(r"\[([0-9]+)\]").match
+
 def _tuple_to_path_str(path: tuple[Union[str, int], ...]):
     result: list[str] = []
     for k in path:
         if isinstance(k, int):
             result.append(f'[{k}]')
         elif isinstance(k, str): # pyright: ignore[reportUnnecessaryIsInstance]
-            if re.fullmatch("[a-zA-Z$_]+[a-zA-Z$_0-9]*", k):
+            if _JS_NAME_FULLMATCH(k):
                 # Mathes JS variable name (like connect like a.b.c)
                 if len(result) == 0:  # First item skip the dot
                     result.append(k)
@@ -58,6 +96,8 @@ class JSONPath:
         >>> print(another_path.data == path.data)
         ... True
     '''
+    __slots__ = ('data',)
+
     def __init__(self, path: Union[str, tuple[Union[str, int], ...]]):
         if isinstance(path, str):
             self.data = JSONPath._from_path_str(path)
@@ -87,7 +127,7 @@ class JSONPath:
                 break
             if curr_path.startswith("."):
                 # Match a.b.c
-                match = re.match(r"\.([a-zA-Z$_]+[a-zA-Z$_0-9]*)", curr_path)
+                match = _PATH_NAME_MATCH(curr_path)
                 if match is None:
                     raise ValueError(f"Invalid path: {path_str}")
                 path.append(match.group(1))
@@ -97,14 +137,14 @@ class JSONPath:
                     raise ValueError(f"Invalid path: {path_str}")
                 if curr_path[1] == '"':
                     # Match ["a"]["b"]["c"]
-                    match = re.match(r'\[("(?:[^"]|\\")*")\]', curr_path)
+                    match = _PATH_QUOTED_KEY_MATCH(curr_path)
                     if match is None:
                         raise ValueError(f"Invalid path: {path_str}")
                     path.append(json.loads(match.group(1)))
                     curr_path = curr_path[match.end():]
                 else:
                     # Match [0][1][2]
-                    match = re.match(r"\[([0-9]+)\]", curr_path)
+                    match = _PATH_INDEX_MATCH(curr_path)
                     if match is None:
                         raise ValueError(f"Invalid path: {path_str}")
                     path.append(int(match.group(1)))
@@ -120,6 +160,11 @@ JSON_PATH_KEY = Union[str, int, JSONPath]
 JSON_SPLIT_KEY = Union[str, Type[int], Type[str], None, Type[SKIP_LIST]]
 JSON_WALKER_DATA = Union[dict[str, Any], list[Any], str, float, int, bool, None, Exception]
 
+# Exact types accepted by JSONWalker. Checked before the slower isinstance
+# check (which is still needed for subclasses and exceptions)
+_JSON_WALKER_DATA_TYPES = frozenset(
+    (dict, list, str, float, int, bool, type(None)))
+
 
 
 class JSONWalker:
@@ -127,16 +172,41 @@ class JSONWalker:
     A class that represents a path in the JSON file for easy access to its
     values.
     '''
+    __slots__ = (
+        '_data', '_parent', '_parent_key', '_cached_path', '_cached_root')
+
     def __init__(
             self, data: JSON_WALKER_DATA, *,
             parent: Optional[JSONWalker] = None,
             parent_key: Optional[JSON_KEY] = None):
-        if not isinstance(
-                data, (Exception, dict, list, str, float, int, bool, type(None))):
+        if type(data) not in _JSON_WALKER_DATA_TYPES and not isinstance(
+                data, (Exception, dict, list, str, float, int, bool)):
             raise ValueError('Input data is not JSON.')
         self._data: JSON_WALKER_DATA = data
+        # The parent is always a JSONWalker or None (for the root), never
+        # any other falsy value. The loops that walk up to the root rely on
+        # the "is not None" check.
+        self._parent: Optional[JSONWalker] = parent
+        self._parent_key: Optional[JSON_KEY] = parent_key
+        # The parents never change so the path and root can be cached
+        self._cached_path: Optional[tuple[JSON_KEY, ...]] = None
+        self._cached_root: Optional[JSONWalker] = None
+
+    @classmethod
+    def _unchecked(
+            cls, data: JSON_WALKER_DATA, parent: Optional[JSONWalker],
+            parent_key: Optional[JSON_KEY]) -> JSONWalker:
+        '''
+        Creates a walker without validating the data. Used internally for the
+        data taken from other walkers, which is already known to be valid.
+        '''
+        self = cls.__new__(cls)
+        self._data = data
         self._parent = parent
         self._parent_key = parent_key
+        self._cached_path = None
+        self._cached_root = None
+        return self
 
     @property
     def parent(self) -> JSONWalker:
@@ -180,6 +250,41 @@ class JSONWalker:
         data = json.load(json_file, **kwargs)
         return JSONWalker(data)
 
+    @staticmethod
+    def load_streaming(
+            json_file: IO[Any], prefix: str = '') -> Iterator[JSONWalker]:
+        '''
+        Creates json walkers for the parts of a JSON file selected by the
+        `prefix`, using the iterative parser from the `ijson` package (an
+        optional dependency). Only one selected part is kept in memory at a
+        time, so it's useful for the large files from which only a small
+        part is needed. For example, the prefix "item" selects the items of
+        the top-level list and "a.b.item" the items of the list at path a.b.
+        The empty prefix selects the entire file.
+
+        Every walker is the root of its own part, so its path doesn't include
+        the prefix. For the files loaded as a whole, :meth:`load` is faster.
+
+        Unlike :meth:`load`, this function can't read the integers that
+        don't fit in 64 bits when `ijson` uses its default (C) backend.
+
+        :raises:
+            :class:`ImportError` - `ijson` is not installed
+
+            `ijson.common.IncompleteJSONError` - invalid JSON or an integer
+            that the `ijson` backend can't read.
+        '''
+        try:
+            import ijson  # type: ignore # pylint: disable=import-outside-toplevel
+        except ImportError as e:
+            raise ImportError(
+                'JSONWalker.load_streaming requires the ijson package.'
+            ) from e
+        # ijson has no type information
+        items = cast(Iterator[JSON], ijson.items(  # pyright: ignore[reportUnknownMemberType]
+            json_file, prefix, use_float=True))
+        return (JSONWalker(item) for item in items)
+
     @property
     def data(self) -> JSON_WALKER_DATA:
         '''
@@ -189,9 +294,10 @@ class JSONWalker:
 
     @data.setter
     def data(self, value: JSON):
+        # pylint: disable=protected-access
         if self._parent is not None:
-            self.parent.data[  # type: ignore
-                self.parent_key  # type: ignore
+            self._parent._data[  # type: ignore
+                self._parent_key  # type: ignore
             ] = value
         self._data = value
 
@@ -224,45 +330,176 @@ class JSONWalker:
             can_create_empty_list_items function parameter). If this value
             is left as None than the lists will be filled with null values.
         '''
-        if self.exists:
+        exists, root, path, _ = self._resolve()
+        if exists:
             if exists_ok:
                 return
             raise ValueError("Path already exists")
         if empty_list_item_factory is None:
             empty_list_item_factory = lambda: None
-        curr_item = self.root
-        path = self.path
-        for key in path:
+        # The data of the root and of every parent of this walker
+        containers: list[Any] = []
+        JSONWalker._fill_path(
+            root, path, containers, data, can_break_data_structure,
+            can_create_empty_list_items, empty_list_item_factory)
+        # Create the walkers for the parents of this walker
+        parent = root
+        for i in range(1, len(path)):
+            parent = JSONWalker._unchecked(containers[i], parent, path[i-1])
+        self._parent = parent
+        self._parent_key = path[-1]
+        self._data = data
+
+    def create_paths(
+            self, items: Iterable[tuple[
+                Union[tuple[JSON_KEY, ...], JSONPath], JSON]], *,
+            exists_ok: bool = True,
+            can_break_data_structure: bool = True,
+            can_create_empty_list_items: bool = True,
+            empty_list_item_factory: Optional[Callable[[], JSON]] = None):
+        '''
+        Creates multiple paths relative to this walker. The result is the
+        same as calling :meth:`create_path` for every path, in the order of
+        the items, but the descent through the common prefix of two
+        consecutive paths is not repeated. The items that share long
+        prefixes should be placed next to each other.
+
+        :param items: the pairs of the paths (relative to this walker) and
+            the data to put at the end of these paths.
+
+        See :meth:`create_path` for the description of the other parameters.
+        '''
+        # pylint: disable=protected-access
+        if empty_list_item_factory is None:
+            empty_list_item_factory = lambda: None
+        root, base_path = self._walk_to_root()
+        # The data at the prefixes of the previous path (root data first)
+        containers: list[Any] = []
+        prev_path: tuple[JSON_KEY, ...] = ()
+        for rel_path, data in items:
+            if isinstance(rel_path, JSONPath):
+                rel_path = rel_path.data
+            path = base_path + tuple(rel_path)
+            # Only the data at the end of the previous path was replaced, so
+            # the containers of its parents are still valid
+            common = 0
+            limit = min(len(path), len(prev_path), len(containers)) - 1
+            while (
+                    common < limit and
+                    path[common] == prev_path[common] and
+                    type(path[common]) is type(prev_path[common])):
+                common += 1
+            del containers[common+1:]
+            curr_data: JSON_WALKER_DATA = (
+                containers[common] if containers else root._data)
+            try:
+                for key in path[common:]:
+                    curr_data = curr_data[key]  # type: ignore
+            except (KeyError, IndexError, TypeError):
+                JSONWalker._fill_path(
+                    root, path, containers, data, can_break_data_structure,
+                    can_create_empty_list_items, empty_list_item_factory)
+            else:
+                if not exists_ok:
+                    raise ValueError("Path already exists")
+                # Nothing was created but the containers are still needed
+                # for the next path (only the ones that create_path would
+                # walk through)
+                if not containers:
+                    containers.append(root._data)
+                curr_data = containers[-1]
+                for key in path[len(containers)-1:-1]:
+                    if type(key) is str:
+                        if not isinstance(curr_data, dict):
+                            break
+                        curr_data = curr_data[key]
+                    elif (
+                            isinstance(key, int) and key >= 0 and
+                            isinstance(curr_data, list)):
+                        curr_data = curr_data[key]
+                    else:
+                        break
+                    containers.append(curr_data)
+            prev_path = path
+
+    @staticmethod
+    def _fill_path(
+            root: JSONWalker, path: tuple[JSON_KEY, ...],
+            containers: list[Any], data: JSON,
+            user_allows_break: bool,
+            can_create_empty_list_items: bool,
+            empty_list_item_factory: Callable[[], JSON]) -> None:
+        '''
+        Creates the missing parts of the path (starting from the root) and
+        puts the data at its end. The containers list holds the data at the
+        first len(containers) prefixes of the path (the data of the root
+        first) and the descent starts from the last of them. The list is
+        extended with the data at the remaining prefixes, so in the end it
+        holds the data of every parent of the path.
+
+        The existing data is replaced with the containers required by the
+        path only if user_allows_break is True (the can_break_data_structure
+        option of create_path) or if the data was created by this function.
+        '''
+        # pylint: disable=protected-access
+        curr_data: JSON_WALKER_DATA
+        next_data: Any
+        # The container that holds curr_data and the key of curr_data
+        # in it (None for the root)
+        parent_container: Any
+        parent_key: Optional[JSON_KEY]
+        depth = len(containers) - 1
+        if depth <= 0:
+            depth = 0
+            curr_data = root._data
+            parent_container, parent_key = None, None
+            containers.clear()
+        else:
+            curr_data = containers.pop()
+            parent_container, parent_key = containers[-1], path[depth-1]
+        # True after the first item created by this function
+        on_fresh_path = False
+        for key in path[depth:]:
             if isinstance(key, str):  # key is a string data must be a dict
-                if not isinstance(curr_item.data, dict):
-                    if not can_break_data_structure:
+                if not isinstance(curr_data, dict):
+                    if not (user_allows_break or on_fresh_path):
                         raise KeyError(key)
-                    curr_item.data = {}
-                if key not in curr_item.data:
-                    can_break_data_structure = True  # Creating new data
-                curr_item = curr_item / key
+                    curr_data = {}
+                    if parent_container is None:
+                        root._data = curr_data
+                    else:
+                        parent_container[parent_key] = curr_data
+                if key not in curr_data:
+                    on_fresh_path = True  # Creating new data
+                    next_data = _MISSING
+                else:
+                    next_data = curr_data[key]
             elif isinstance(key, int):  # pyright: ignore[reportUnnecessaryIsInstance]
                 # key is an int data must be a list
                 if key < 0:
                     raise KeyError(key)
-                if not isinstance(curr_item.data, list):
-                    if not can_break_data_structure:
+                if not isinstance(curr_data, list):
+                    if not (user_allows_break or on_fresh_path):
                         raise KeyError(key)
-                    curr_item.data = []
-                if len(curr_item.data)-1 < key:
+                    curr_data = []
+                    if parent_container is None:
+                        root._data = curr_data
+                    else:
+                        parent_container[parent_key] = curr_data
+                if len(curr_data)-1 < key:
                     if not can_create_empty_list_items:
                         raise KeyError(key)
-                    curr_item.data += [
+                    curr_data.extend([
                         empty_list_item_factory()
-                        for _ in range(1+key-len(curr_item.data))
-                    ]
-                    can_break_data_structure = True  # Creating new data
-                curr_item = curr_item / key
+                        for _ in range(1+key-len(curr_data))
+                    ])
+                    on_fresh_path = True  # Creating new data
+                next_data = curr_data[key]
             else:
                 raise KeyError(key)
-        self._parent = curr_item.parent
-        self._parent_key = curr_item.parent_key
-        self.data = data
+            containers.append(curr_data)
+            parent_container, parent_key, curr_data = curr_data, key, next_data
+        parent_container[parent_key] = data
 
     @property
     def exists(self) -> bool:
@@ -272,35 +509,56 @@ class JSONWalker:
         even if the object is detached from the root somewhere in the middle
         of the path, the function will still return correct value.
         '''
-        keys: list[JSON_KEY] = []
-        root = self
-        try:
-            while True:
-                keys.append(root.parent_key)
-                root = root.parent
-        except KeyError:
-            pass
-        keys = list(reversed(keys))
-        root_data = root.data
+        return self._resolve()[0]
+
+    def _walk_to_root(self) -> tuple[JSONWalker, tuple[JSON_KEY, ...]]:
+        '''
+        Returns the root walker and the path of this walker. If they're not
+        cached yet, both are found in a single pass over the parents and
+        cached.
+        '''
+        # pylint: disable=protected-access
+        if self._cached_path is None or self._cached_root is None:
+            # Walk up only to the first parent that knows both values
+            keys: list[JSON_KEY] = []
+            node = self
+            while (
+                    node._parent is not None and
+                    (node._cached_path is None or node._cached_root is None)):
+                keys.append(node._parent_key)  # type: ignore
+                node = node._parent
+            keys.reverse()
+            if node._parent is None:
+                self._cached_path = tuple(keys)
+                self._cached_root = node
+            else:
+                base = cast(tuple[JSON_KEY, ...], node._cached_path)
+                self._cached_path = base + tuple(keys)
+                self._cached_root = cast(JSONWalker, node._cached_root)
+        return self._cached_root, self._cached_path
+
+    def _resolve(self) -> tuple[
+            bool, JSONWalker, tuple[JSON_KEY, ...], JSON_WALKER_DATA]:
+        '''
+        Follows the path of this walker starting from the root data. Returns
+        a tuple with: information if the path exists, the root walker, the
+        path and the data at the end of the path (None if it doesn't exist).
+        '''
+        root, path = self._walk_to_root()
+        data = root._data
         try:
-            for key in keys:
-                root_data = root_data[key]  # type: ignore
-        except:  # pylint: disable=bare-except
-            return False
-        return True
+            for key in path:
+                data = data[key]  # type: ignore
+        except (KeyError, IndexError, TypeError):
+            return False, root, path, None
+        return True, root, path, cast(JSON_WALKER_DATA, data)
 
     @property
     def root(self) -> JSONWalker:
         '''
         The root object of this JSON file.
         '''
-        root = self
-        try:
-            while True:
-                root = root.parent
-        except KeyError:
-            pass
-        return root
+        return self._walk_to_root()[0]
 
     @property
     def path(self) -> tuple[JSON_KEY, ...]:
@@ -308,15 +566,7 @@ class JSONWalker:
         Full JSON path up to this point starting from the root of the JSON file
         in from of a tuple of keys.
         '''
-        result: list[JSON_KEY] = []
-        parent = self
-        try:
-            while True:
-                result.append(parent.parent_key)
-                parent = parent.parent
-        except KeyError:
-            pass
-        return tuple(reversed(result))
+        return self._walk_to_root()[1]
 
     @property
     def path_str(self) -> str:
@@ -333,14 +583,21 @@ class JSONWalker:
         if isinstance(key, JSONPath):
             walker = self
             for k in key.data:
-                walker = walker / k
+                walker = walker._div(k)
             return walker
+        return self._div(key)
+
+    def _div(self, key: JSON_KEY) -> JSONWalker:
+        '''
+        The implementation of the `/` operator for a single key (not a
+        :class:`JSONPath`).
+        '''
         try:
-            return JSONWalker(
-                self.data[key],  # type: ignore
-                parent=self, parent_key=key)
+            return JSONWalker._unchecked(
+                self._data[key],  # type: ignore
+                self, key)
         except Exception as e:  # pylint: disable=broad-except
-            return JSONWalker(e, parent=self, parent_key=key)
+            return JSONWalker._unchecked(e, self, key)
 
     def __floordiv__(self, key: JSON_SPLIT_KEY) -> JSONSplitWalker:
         '''
@@ -352,53 +609,11 @@ class JSONWalker:
 
             :class:`re.error` - invlid regular expression.
         '''
-        # pylint: disable=too-many-return-statements
-        # ANYTHING
-        if key is None:
-            if isinstance(self.data, dict):
-                return JSONSplitWalker([
-                    JSONWalker(v, parent=self, parent_key=k)
-                    for k, v in self.data.items()
-                ])
-            if isinstance(self.data, list):
-                return JSONSplitWalker([
-                    JSONWalker(v, parent=self, parent_key=i)
-                    for i, v in enumerate(self.data)
-                ])
-        # ANY LIST ITEM
-        elif key is int:
-            if isinstance(self.data, list):
-                return JSONSplitWalker([
-                    JSONWalker(v, parent=self, parent_key=i)
-                    for i, v in enumerate(self.data)
-                ])
-        # ANY DICT ITEM
-        elif key is str:
-            if isinstance(self.data, dict):
-                return JSONSplitWalker([
-                    JSONWalker(v, parent=self, parent_key=k)
-                    for k, v in self.data.items()
-                ])
-        # REGEX DICT ITEM
-        elif isinstance(key, str):
-            if isinstance(self.data, dict):
-                result: list[JSONWalker] = []
-                for k, v in self.data.items():
-                    if re.fullmatch(key, k):
-                        result.append(JSONWalker(
-                            v, parent=self, parent_key=k))
-                return JSONSplitWalker(result)
-        # IF it's a list use ing key ELSE return split walker with self
-        elif key is SKIP_LIST:
-            if isinstance(self.data, list):
-                return self // int
-            return JSONSplitWalker([self])
-        else:  # INVALID KEY TYPE
-            raise TypeError(
-                'Key must be a regular expression or one of the values: '
-                'str, int, or None')
-        # DATA DOESN'T ACCEPT THIS TYPE OF KEY
-        return JSONSplitWalker([])
+        _check_split_key(key)
+        # Only SKIP_LIST can return the walker itself
+        return _new_split_walker(
+            _floordiv_list(self, key),
+            key is not SKIP_LIST or not isinstance(self._data, Exception))
 
     def __add__(self, other: Union[JSONSplitWalker, JSONWalker]) -> JSONSplitWalker:
         '''
@@ -406,11 +621,131 @@ class JSONWalker:
         values.
         '''
         if isinstance(other, JSONWalker):
-            data = [self, other]
-        else:
-            data = other.data + [self]
-        return JSONSplitWalker(
-            [i for i in data if not isinstance(i.data, Exception)])
+            return JSONSplitWalker([self]) + other
+        return other + self
+
+# Creates the walkers for the data taken from other walkers. The only
+# internal constructor of JSONWalker used outside of the class.
+# pylint: disable-next=protected-access
+_new_walker = JSONWalker._unchecked  # pyright: ignore[reportPrivateUsage]
+
+# Handlers of the special keys of the `//` operator. They return lists
+# because list comprehensions are the fastest way to create the walkers.
+def _split_any(walker: JSONWalker) -> list[JSONWalker]:
+    '''Handles the None key (any dict or list item).'''
+    data = walker.data
+    if isinstance(data, dict):
+        return [_new_walker(v, walker, k) for k, v in data.items()]
+    if isinstance(data, list):
+        return [_new_walker(v, walker, i) for i, v in enumerate(data)]
+    return []
+
+def _split_any_list(walker: JSONWalker) -> list[JSONWalker]:
+    '''Handles the int key (any list item).'''
+    data = walker.data
+    if isinstance(data, list):
+        return [_new_walker(v, walker, i) for i, v in enumerate(data)]
+    return []
+
+def _split_any_dict(walker: JSONWalker) -> list[JSONWalker]:
+    '''Handles the str key (any dict item).'''
+    data = walker.data
+    if isinstance(data, dict):
+        return [_new_walker(v, walker, k) for k, v in data.items()]
+    return []
+
+def _split_skip_list(walker: JSONWalker) -> list[JSONWalker]:
+    '''
+    Handles the SKIP_LIST key (any list item if the walker points at a list,
+    otherwise the walker itself).
+    '''
+    if isinstance(walker.data, list):
+        return _split_any_list(walker)
+    return [walker]
+
+def _split_regex(walker: JSONWalker, pattern: str) -> list[JSONWalker]:
+    '''Handles the regular expression keys (matching dict items).'''
+    data = walker.data
+    if isinstance(data, dict):
+        fullmatch = _compile_fullmatch(pattern)
+        return [
+            _new_walker(v, walker, k)
+            for k, v in data.items() if fullmatch(k)]
+    return []
+
+# Maps the ids of the special keys of the `//` operator to their handlers
+_SPLIT_DISPATCH: dict[int, Callable[[JSONWalker], list[JSONWalker]]] = {
+    id(None): _split_any,
+    id(int): _split_any_list,
+    id(str): _split_any_dict,
+    id(SKIP_LIST): _split_skip_list,
+}
+
+def _floordiv_list(walker: JSONWalker, key: JSON_SPLIT_KEY) -> list[JSONWalker]:
+    '''
+    Returns a new list of the walkers that match the key of the `//`
+    operator. The key must be validated with :func:`_check_split_key` first.
+    '''
+    handler = _SPLIT_DISPATCH.get(id(key))
+    if handler is not None:
+        return handler(walker)
+    return _split_regex(walker, cast(str, key))
+
+def _floordiv_walkers(
+        walkers: Iterable[JSONWalker], key: JSON_SPLIT_KEY
+) -> Iterator[JSONWalker]:
+    '''
+    Applies the `//` operator to the walkers. The key must be validated with
+    :func:`_check_split_key` first.
+    '''
+    handler = _SPLIT_DISPATCH.get(id(key))
+    if handler is None:  # Regular expression
+        pattern = cast(str, key)
+        for walker in walkers:
+            yield from _split_regex(walker, pattern)
+        return
+    for walker in walkers:
+        yield from handler(walker)
+
+def _try_path(
+        walker: JSONWalker, keys: tuple[JSON_KEY, ...]) -> Optional[JSONWalker]:
+    '''
+    Works like the `/` operator with a :class:`JSONPath` but returns None
+    instead of a walker that points at an exception.
+    '''
+    # The empty path returns the walker itself, which can point at an
+    # exception
+    if isinstance(walker.data, Exception):
+        return None
+    for key in keys:
+        data: Any = walker.data
+        try:
+            walker = _new_walker(data[key], walker, key)
+        except (KeyError, IndexError, TypeError):
+            return None
+    return walker
+
+def _truediv_walkers(
+        walkers: Iterable[JSONWalker], key: JSON_PATH_KEY
+) -> Iterator[JSONWalker]:
+    '''
+    Applies the `/` operator to the walkers, skipping the keys that don't
+    exist.
+    '''
+    if isinstance(key, JSONPath):
+        keys = key.data
+        for walker in walkers:
+            new_walker = _try_path(walker, keys)
+            if new_walker is not None:
+                yield new_walker
+        return
+    for walker in walkers:
+        data: Any = walker.data
+        try:
+            value = data[key]
+        except (KeyError, IndexError, TypeError):
+            continue
+        yield _new_walker(value, walker, key)
 
 
 class JSONSplitWalker:
@@ -418,9 +753,25 @@ class JSONSplitWalker:
     Multiple walker objects grouped together. This class can be browse JSON
     file contents from multiple JSON paths at once.
     '''
+    __slots__ = ('_data', '_clean')
 
     def __init__(self, data: list[JSONWalker]) -> None:
         self._data: list[JSONWalker] = data
+        # True if it's known that none of the walkers points at an exception
+        self._clean: bool = False
+
+    @classmethod
+    def _new(cls, data: list[JSONWalker], clean: bool) -> JSONSplitWalker:
+        '''
+        Creates a split walker without copying the list of walkers.
+
+        :param clean: whether the walkers are known not to point at
+            exceptions.
+        '''
+        self = cls.__new__(cls)
+        self._data = data
+        self._clean = clean
+        return self
 
     @property
     def data(self) -> list[JSONWalker]:
@@ -434,12 +785,8 @@ class JSONSplitWalker:
         Applies `/` operator to all of the :class:`JSONWalkers` in this split
         walker.
         '''
-        result: list[JSONWalker] = []
-        for walker in self.data:
-            new_walker = walker / key
-            if not isinstance(new_walker.data, Exception):
-                result.append(new_walker)
-        return JSONSplitWalker(result)
+        return JSONSplitWalker._new(
+            list(_truediv_walkers(self._data, key)), True)
 
     def __floordiv__(self, key: JSON_SPLIT_KEY) -> JSONSplitWalker:
         '''
@@ -447,11 +794,11 @@ class JSONSplitWalker:
         walker, creating even more split walkers (all groupped together in
         one object).
         '''
-        result: list[JSONWalker] = []
-        for walker in self.data:
-            new_walker = walker // key
-            result.extend(new_walker.data)
-        return JSONSplitWalker(result)
+        _check_split_key(key)
+        # Only SKIP_LIST can pass the walkers with exceptions through
+        return JSONSplitWalker._new(
+            list(_floordiv_walkers(self._data, key)),
+            self._clean or key is not SKIP_LIST)
 
     def __add__(self, other: Union[JSONSplitWalker, JSONWalker]) -> JSONSplitWalker:
         '''
@@ -459,11 +806,15 @@ class JSONSplitWalker:
         values.
         '''
         if isinstance(other, JSONWalker):
-            data = self.data + [other]
+            other_data = [other]
+            other_clean = not isinstance(other.data, Exception)
         else:
-            data = self.data + other.data
-        return JSONSplitWalker(
-            [i for i in data if not isinstance(i.data, Exception)])
+            other_data, other_clean = other.data, other._clean
+        data = self.data + other_data
+        if self._clean and other_clean:
+            return JSONSplitWalker._new(data, True)
+        return JSONSplitWalker._new(
+            [i for i in data if not isinstance(i.data, Exception)], True)
 
     def __iter__(self) -> Iterator[JSONWalker]:
         '''
@@ -477,3 +828,81 @@ class JSONSplitWalker:
         Return the number of walkers contained in this object.
         '''
         return len(self.data)
+
+# The only internal constructor of JSONSplitWalker used outside of the class
+# pylint: disable-next=protected-access
+_new_split_walker = JSONSplitWalker._new  # pyright: ignore[reportPrivateUsage]
+
+
+class JSONQuery:
+    '''
+    A chain of the `/` and `//` operators prepared once and applied to many
+    walkers (for example to the same part of many JSON files). The query is
+    built with the same operators as the walkers. The keys are validated
+    when the query is built, so applying it only runs the steps.
+
+    Example:
+        >>> query = JSONQuery() // '[a-z]+' // None / 'x'
+        >>> walker = JSONWalker({"a": [{"x": 1}, {"y": 2}], "B": [{"x": 3}]})
+        >>> [w.data for w in query.apply(walker)]
+        [1]
+    '''
+    __slots__ = ('_steps', '_passes_errors')
+
+    def __init__(self) -> None:
+        self._steps: tuple[
+            Callable[[Iterator[JSONWalker]], Iterator[JSONWalker]], ...] = ()
+        # False if any of the steps removes the walkers with exceptions
+        self._passes_errors: bool = True
+
+    def _add_step(
+            self, step: Callable[[Iterator[JSONWalker]], Iterator[JSONWalker]],
+            passes_errors: bool) -> JSONQuery:
+        '''Returns a copy of this query with an additional step.'''
+        # pylint: disable=protected-access
+        result = JSONQuery()
+        result._steps = self._steps + (step,)
+        result._passes_errors = self._passes_errors and passes_errors
+        return result
+
+    def __truediv__(self, key: JSON_PATH_KEY) -> JSONQuery:
+        '''
+        Creates a query with the `/` operator added at the end.
+        '''
+        return self._add_step(
+            lambda walkers: _truediv_walkers(walkers, key), False)
+
+    def __floordiv__(self, key: JSON_SPLIT_KEY) -> JSONQuery:
+        '''
+        Creates a query with the `//` operator added at the end.
+
+        :raises:
+            :class:`TypeError` - invalid input data type
+
+            :class:`re.error` - invlid regular expression.
+        '''
+        _check_split_key(key)
+        return self._add_step(
+            lambda walkers: _floordiv_walkers(walkers, key),
+            key is SKIP_LIST)
+
+    def apply(
+            self, walker: Union[JSONWalker, JSONSplitWalker]
+    ) -> JSONSplitWalker:
+        '''
+        Runs the query on a walker (or on all of the walkers of a split
+        walker) and returns the split walker with the results.
+        '''
+        walkers: Iterator[JSONWalker]
+        if isinstance(walker, JSONWalker):
+            walkers = iter((walker,))
+            clean = not isinstance(walker.data, Exception)
+        else:
+            # The split walkers are treated as if they could contain the
+            # walkers with exceptions
+            walkers = iter(walker.data)
+            clean = False
+        for step in self._steps:
+            walkers = step(walkers)
+        return _new_split_walker(
+            list(walkers), clean or not self._passes_errors)